@@ -1,7 +1,9 @@
 import json
 from lark import Lark, Transformer
-from rdflib import Graph, Literal, RDF, URIRef, Namespace
-from rdflib.namespace import FOAF, RDFS
+
+# rdflib is only needed for RDF/JSON-LD output and is imported lazily in
+# those code paths, so plain compilation stays cheap to start.
+AMNE_NAMESPACE = "http://sovereign.ascension/amne#"
 
 # Define the AMNE Ontological Grammar
 grammar = r"""
@@ -41,7 +43,18 @@ class AMNECompiler:
     def __init__(self):
         self.parser = Lark(grammar, start='start')
         self.transformer = AMNETransformer()
-        self.ns = Namespace("http://sovereign.ascension/amne#")
+        self._ns = None
+
+    @property
+    def ns(self):
+        if self._ns is None:
+            from rdflib import Namespace
+            self._ns = Namespace(AMNE_NAMESPACE)
+        return self._ns
+
+    @ns.setter
+    def ns(self, value):
+        self._ns = value
 
     def compile(self, text):
         tree = self.parser.parse(text)
@@ -49,6 +62,9 @@ class AMNECompiler:
         return data
 
     def to_rdf(self, data):
+        from rdflib import Graph, Literal, RDF, URIRef
+        from rdflib.namespace import RDFS
+
         g = Graph()
         g.bind("amne", self.ns)
 
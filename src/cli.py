@@ -0,0 +1,279 @@
+"""
+Unified command line entry point for the src/ tools.
+
+    python -m src.cli compile FILE [--format data|turtle|json-ld]
+    python -m src.cli upload BUCKET FILE [--region REGION]
+    python -m src.cli dashboard [--serve] [--port PORT]
+    python -m src.cli governor
+    python -m src.cli serve
+    python -m src.cli bench [--runs N] [--top N]
+
+Only the standard library is imported at module load. lark, rdflib, boto3
+and dash are imported inside the subcommand that needs them, so short
+batch runs only pay for the dependencies they actually use.
+
+`serve` keeps one process alive and reads one command per line from stdin
+(same syntax as the command line, without the program name). Compilers and
+S3 clients are cached in-process, so repeated invocations skip the grammar
+build and client setup. Since stdin carries the commands, '-' is not
+accepted as a file argument inside `serve`.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+
+# typing is only needed by type checkers; importing it would add measurably
+# to CLI startup, so annotations use builtin generics and are never evaluated.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from .s3_multipart_upload import SovereignUploader
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# --- WORKER CACHES (reused across subcommands in `serve` mode) ---
+
+_compiler = None
+_uploaders: dict[tuple[str, str], SovereignUploader] = {}
+
+
+def get_compiler():
+    """Returns the process-wide AMNECompiler, building the parser on first use."""
+    global _compiler
+    if _compiler is None:
+        from .amne_compiler import AMNECompiler
+        _compiler = AMNECompiler()
+    return _compiler
+
+
+def get_uploader(bucket_name: str, region_name: str = "us-east-1"):
+    """Returns a cached SovereignUploader (and its boto3 client) per bucket/region."""
+    key = (bucket_name, region_name)
+    if key not in _uploaders:
+        from .s3_multipart_upload import SovereignUploader
+        _uploaders[key] = SovereignUploader(bucket_name, region_name=region_name)
+    return _uploaders[key]
+
+
+# --- SUBCOMMANDS ---
+
+def cmd_compile(args) -> int:
+    if args.file == "-":
+        text = sys.stdin.read()
+    else:
+        with open(args.file, "r", encoding="utf-8") as f:
+            text = f.read()
+
+    compiler = get_compiler()
+    data = compiler.compile(text)
+    if args.format == "turtle":
+        print(compiler.to_rdf(data).serialize(format="turtle"))
+    elif args.format == "json-ld":
+        print(compiler.to_json_ld(data))
+    else:
+        print(data)
+    return 0
+
+
+def cmd_upload(args) -> int:
+    uploader = get_uploader(args.bucket, args.region)
+    return 0 if uploader.upload_file(args.file, args.object_name) else 1
+
+
+def cmd_dashboard(args) -> int:
+    from .semantic_dashboard import app
+    if args.serve:
+        app.run(debug=args.debug, port=args.port)
+    else:
+        print("Semantic Dashboard layout defined.")
+    return 0
+
+
+def cmd_governor(args) -> int:
+    from .watchtower_governor import main
+    main()
+    return 0
+
+
+def cmd_serve(args) -> int:
+    """Reads commands from stdin until EOF, reusing cached parsers and clients."""
+    import shlex
+
+    parser = build_parser()
+    for line in sys.stdin:
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        try:
+            argv = shlex.split(line)
+            if argv and argv[0] in ("serve", "bench"):
+                print(f"Error: '{argv[0]}' is not available inside serve mode.")
+                status = 2
+            elif argv[:1] == ["dashboard"] and "--serve" in argv[1:]:
+                # app.run() would block the worker loop (and the debug
+                # reloader would re-spawn a worker on the same stdin).
+                print("Error: 'dashboard --serve' is not available inside serve mode.")
+                status = 2
+            elif "-" in argv[1:]:
+                print("Error: '-' (stdin) cannot be used as a file inside serve mode.")
+                status = 2
+            else:
+                status = run(argv, parser)
+        except SystemExit as e:
+            # argparse exits on bad input; keep the worker alive.
+            status = e.code if isinstance(e.code, int) else 2
+        except Exception as e:
+            print(f"Error: {e}")
+            status = 1
+        print(f"[exit {status}]", flush=True)
+    return 0
+
+
+# --- STARTUP BENCHMARK ---
+
+_IMPORTTIME_PATTERN = r"^import time:\s+(\d+)\s*\|\s*(\d+)\s*\|\s*(\S+)\s*$"
+
+_BENCH_SAMPLE = "שכל פועל הוא נמצא.\nנתיב 1: צירוף -> שכל פועל -> נבואי.\n"
+
+# Builds the S3 client exactly as `upload` does, without touching the network.
+_BENCH_UPLOAD_SETUP = "from src import cli; cli.get_uploader('bench-bucket')"
+
+
+def parse_importtime(stderr: str) -> list[tuple[str, int, int]]:
+    """Parses `-X importtime` output into (module, self_us, cumulative_us) rows."""
+    import re
+
+    rows = []
+    for line in stderr.splitlines():
+        match = re.match(_IMPORTTIME_PATTERN, line)
+        if match:
+            self_us, cumulative_us, module = match.groups()
+            rows.append((module, int(self_us), int(cumulative_us)))
+    return rows
+
+
+def _measure(argv: list[str], runs: int):
+    """
+    Runs `python <argv>` from the repo root. Returns (import_rows, best_wall_s),
+    or None if the command fails (e.g. a dependency is not installed).
+    """
+    import subprocess
+    import time
+
+    command = [sys.executable, "-X", "importtime"] + argv
+    result = subprocess.run(command, capture_output=True, text=True, cwd=REPO_ROOT)
+    if result.returncode != 0:
+        return None
+
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable] + argv, stdout=subprocess.DEVNULL,
+                       stderr=subprocess.DEVNULL, cwd=REPO_ROOT, check=False)
+        best = min(best, time.perf_counter() - start)
+    return parse_importtime(result.stderr), best
+
+
+def cmd_bench(args) -> int:
+    """
+    Compares the startup path each subcommand actually runs against importing
+    the matching tool module directly (what the per-script entry points pay on
+    every start). Where a subcommand cannot run offline, the CLI side stops at
+    the setup it would do and the label says so.
+    """
+    import tempfile
+
+    with tempfile.NamedTemporaryFile("w", suffix=".amne", encoding="utf-8", delete=False) as f:
+        f.write(_BENCH_SAMPLE)
+        sample = f.name
+
+    cases = [
+        ("compile FILE", ["-m", "src.cli", "compile", sample], "src.amne_compiler"),
+        ("upload (client setup)", ["-c", _BENCH_UPLOAD_SETUP], "src.s3_multipart_upload"),
+        ("dashboard (no --serve)", ["-m", "src.cli", "dashboard"], "src.semantic_dashboard"),
+        ("governor (import only)", ["-c", "import src.cli, src.watchtower_governor"],
+         "src.watchtower_governor"),
+        ("--help (parse only)", ["-m", "src.cli", "--help"], None),
+    ]
+
+    print("--- STARTUP BENCHMARK (-X importtime, best wall over %d runs) ---" % args.runs)
+    print(f"{'CLI path':<24}{'import ms':>11}{'wall ms':>10}"
+          f"   {'import <module>':<26}{'import ms':>11}{'wall ms':>10}")
+    try:
+        for label, cli_args, module in cases:
+            cli_result = _measure(cli_args, args.runs)
+            direct = ""
+            if module:
+                direct_result = _measure(["-c", f"import {module}"], args.runs)
+                direct = f"{module:<26}{_format_measure(direct_result)}"
+            print(f"{label:<24}{_format_measure(cli_result)}   {direct}".rstrip())
+
+            if args.top and cli_result:
+                heaviest = sorted(cli_result[0], key=lambda r: r[1], reverse=True)[:args.top]
+                for name, self_us, _ in heaviest:
+                    print(f"    {name:<36}{self_us / 1000:>8.1f} ms self")
+    finally:
+        os.remove(sample)
+    print("-" * 92)
+    return 0
+
+
+def _format_measure(result) -> str:
+    if result is None:
+        return f"{'unavailable':>21}"
+    rows, wall = result
+    total_us = sum(self_us for _, self_us, _ in rows)
+    return f"{total_us / 1000:>11.1f}{wall * 1000:>10.1f}"
+
+
+# --- ARGUMENT PARSING ---
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="src.cli", description=__doc__.strip().splitlines()[0])
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("compile", help="Compile AMNE text")
+    p.add_argument("file", help="Source file, or '-' for stdin")
+    p.add_argument("--format", choices=["data", "turtle", "json-ld"], default="data")
+    p.set_defaults(func=cmd_compile)
+
+    p = sub.add_parser("upload", help="Resumable S3 multipart upload")
+    p.add_argument("bucket")
+    p.add_argument("file")
+    p.add_argument("--object-name", default=None)
+    p.add_argument("--region", default="us-east-1")
+    p.set_defaults(func=cmd_upload)
+
+    p = sub.add_parser("dashboard", help="Build (and optionally serve) the semantic dashboard")
+    p.add_argument("--serve", action="store_true")
+    p.add_argument("--port", type=int, default=8050)
+    p.add_argument("--debug", action="store_true")
+    p.set_defaults(func=cmd_dashboard)
+
+    p = sub.add_parser("governor", help="Run the watchtower governor workflow")
+    p.set_defaults(func=cmd_governor)
+
+    p = sub.add_parser("serve", help="Persistent worker: read commands from stdin")
+    p.set_defaults(func=cmd_serve)
+
+    p = sub.add_parser("bench", help="Measure startup/import time of each entry point")
+    p.add_argument("--runs", type=int, default=5)
+    p.add_argument("--top", type=int, default=0, help="Also list the N slowest imports")
+    p.set_defaults(func=cmd_bench)
+
+    return parser
+
+
+def run(argv: list[str], parser: argparse.ArgumentParser | None = None) -> int:
+    parser = parser or build_parser()
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+def main(argv: list[str] | None = None) -> int:
+    return run(sys.argv[1:] if argv is None else argv)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
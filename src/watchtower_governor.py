@@ -148,8 +148,8 @@ def load_component(filename: str):
         return None
 
 
-if __name__ == "__main__":
-
+def main():
+    """Runs the full seal / execute / one-shot insertion workflow."""
     # 1. ESTABLISH AND SEAL THE GOVERNING RULE
     GOV_CONSTANT_FILE = "governing_rule.pkl"
     constant = TemporalGoverningConstant()
@@ -200,3 +200,7 @@ if __name__ == "__main__":
     # Clean up (optional)
     # os.remove(GOV_CONSTANT_FILE)
     # os.remove(CONFIG_FILE)
+
+
+if __name__ == "__main__":
+    main()
@@ -38,3 +38,10 @@ def test_json_ld_output():
     data = compiler.compile(text)
     json_ld = compiler.to_json_ld(data)
     assert "http://sovereign.ascension/amne#" in json_ld
+
+def test_namespace_can_be_overridden():
+    from rdflib import Namespace
+    compiler = AMNECompiler()
+    compiler.ns = Namespace("http://example.org/custom#")
+    data = compiler.compile("א הוא ב.")
+    assert "http://example.org/custom#" in compiler.to_json_ld(data)
@@ -0,0 +1,155 @@
+import io
+import os
+import subprocess
+import sys
+import pytest
+from unittest.mock import patch
+from botocore.exceptions import ClientError
+from src import cli, watchtower_governor
+from src.s3_multipart_upload import STATE_FILE
+
+HEAVY_MODULES = ["lark", "rdflib", "boto3", "dash", "plotly", "dash_cytoscape"]
+DEFERRED_STDLIB_MODULES = ["subprocess", "shlex", "tempfile", "typing"]
+
+@pytest.fixture
+def source_file(tmp_path):
+    path = tmp_path / "sample.amne"
+    path.write_text("א הוא ב.", encoding="utf-8")
+    return str(path)
+
+@pytest.fixture
+def reset_caches():
+    cli._compiler = None
+    cli._uploaders.clear()
+    yield
+    cli._compiler = None
+    cli._uploaders.clear()
+
+@pytest.fixture
+def mock_s3():
+    with patch('boto3.client') as mock_client:
+        yield mock_client
+
+@pytest.fixture
+def cleanup_state():
+    if os.path.exists(STATE_FILE):
+        os.remove(STATE_FILE)
+    yield
+    if os.path.exists(STATE_FILE):
+        os.remove(STATE_FILE)
+
+@pytest.fixture
+def upload_file(tmp_path):
+    path = tmp_path / "test_file.bin"
+    path.write_bytes(os.urandom(1024))
+    return str(path)
+
+def test_cli_import_defers_heavy_dependencies():
+    code = (
+        "import sys, src.cli; "
+        f"print([m for m in {HEAVY_MODULES!r} if m in sys.modules])"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "[]"
+
+def test_cli_import_defers_bench_and_serve_modules():
+    code = (
+        "import sys, src.cli; "
+        f"print([m for m in {DEFERRED_STDLIB_MODULES!r} if m in sys.modules])"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "[]"
+
+def test_compiler_import_defers_rdflib():
+    code = "import sys, src.amne_compiler; print('rdflib' in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "False"
+
+def test_compile_subcommand(source_file, reset_caches, capsys):
+    assert cli.main(["compile", source_file]) == 0
+    assert "('statement', 'א', 'הוא', 'ב')" in capsys.readouterr().out
+
+def test_compile_json_ld(source_file, reset_caches, capsys):
+    assert cli.main(["compile", source_file, "--format", "json-ld"]) == 0
+    assert "http://sovereign.ascension/amne#" in capsys.readouterr().out
+
+def test_serve_reuses_compiler(source_file, reset_caches, monkeypatch, capsys):
+    commands = f"compile {source_file}\ncompile {source_file}\nnot-a-command\n"
+    monkeypatch.setattr(sys, "stdin", io.StringIO(commands))
+
+    built = []
+    original = cli.get_compiler
+    def tracking_get_compiler():
+        if cli._compiler is None:
+            built.append(True)
+        return original()
+    monkeypatch.setattr(cli, "get_compiler", tracking_get_compiler)
+
+    assert cli.main(["serve"]) == 0
+    out = capsys.readouterr().out
+    assert out.count("[exit 0]") == 2
+    assert "[exit 2]" in out
+    assert len(built) == 1
+
+def test_serve_rejects_stdin_file(source_file, reset_caches, monkeypatch, capsys):
+    commands = f"compile -\nא הוא ב.\ncompile {source_file}\n"
+    monkeypatch.setattr(sys, "stdin", io.StringIO(commands))
+
+    assert cli.main(["serve"]) == 0
+    out = capsys.readouterr().out
+    assert "'-' (stdin) cannot be used" in out
+    # The stray source line is treated as a bad command; the next compile still runs.
+    assert out.count("[exit 2]") == 2
+    assert "[exit 0]" in out
+    assert "('statement', 'א', 'הוא', 'ב')" in out
+
+def test_serve_rejects_dashboard_server(reset_caches, monkeypatch, capsys):
+    monkeypatch.setattr(sys, "stdin", io.StringIO("dashboard --serve --debug\n"))
+
+    assert cli.main(["serve"]) == 0
+    out = capsys.readouterr().out
+    assert "'dashboard --serve' is not available" in out
+    assert "[exit 2]" in out
+
+def test_uploader_cached_per_bucket(mock_s3, reset_caches):
+    first = cli.get_uploader("test-bucket")
+    second = cli.get_uploader("test-bucket")
+    other = cli.get_uploader("other-bucket")
+    assert first is second
+    assert first is not other
+    assert mock_s3.call_count == 2
+
+def test_upload_subcommand_success(mock_s3, reset_caches, cleanup_state, upload_file):
+    client_instance = mock_s3.return_value
+    client_instance.create_multipart_upload.return_value = {"UploadId": "123"}
+    client_instance.upload_part.return_value = {"ETag": "abc"}
+
+    assert cli.main(["upload", "test-bucket", upload_file]) == 0
+    client_instance.complete_multipart_upload.assert_called_once()
+
+def test_upload_subcommand_failure_exit_code(mock_s3, reset_caches, cleanup_state, upload_file):
+    client_instance = mock_s3.return_value
+    client_instance.create_multipart_upload.side_effect = ClientError(
+        {"Error": {"Code": "AccessDenied", "Message": "denied"}}, "CreateMultipartUpload"
+    )
+
+    assert cli.main(["upload", "test-bucket", upload_file]) == 1
+    client_instance.complete_multipart_upload.assert_not_called()
+
+def test_parse_importtime():
+    stderr = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       120 |        120 |     _io\n"
+        "import time:      2453 |      67343 |   rdflib\n"
+    )
+    assert cli.parse_importtime(stderr) == [("_io", 120, 120), ("rdflib", 2453, 67343)]
+
+def test_governor_subcommand(monkeypatch):
+    calls = []
+    monkeypatch.setattr(watchtower_governor, "main", lambda: calls.append(True))
+
+    assert cli.main(["governor"]) == 0
+    assert calls == [True]